@@ -8,87 +8,599 @@ Features:
 - Remove tasks
 - View all tasks
 - Mark tasks as completed
-- Persistent storage in a text file
+- Persistent storage in a text file or SQLite database
 """
 
+import io
 import os
+import sys
 import json
-from datetime import datetime
+import mmap
+import re
+import time
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import starmap
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the standard library
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # optional: fall back to _loads
+    simdjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for .zst task files
+    zstandard = None
+
+# The journal is folded back into the snapshot once it holds more than
+# this many events per task.
+COMPACT_RATIO = 4
+
+# Every zstd frame starts with these bytes.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Matched directly against the mapped snapshot, so skipping leading
+# whitespace does not copy the file.
+_LEADING_WHITESPACE = re.compile(rb"\s*")
+
+
+@dataclass(slots=True, eq=False)
+class Task:
+    """A single to-do item.
+    
+    Timestamps are seconds since the epoch (or preformatted strings for
+    tasks saved by older versions); completed_at is None until the task
+    is completed. Tasks compare by identity, so removing one from the
+    task list never compares field values.
+    """
+    
+    id: int
+    description: str
+    completed: bool = False
+    created_at: int = 0
+    completed_at: int | None = None
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Task from its JSON representation."""
+        return cls(data["id"], data["description"], data["completed"],
+                   data["created_at"], data.get("completed_at"))
+    
+    def to_dict(self):
+        """Return the JSON representation of the task."""
+        return {
+            "id": self.id,
+            "description": self.description,
+            "completed": self.completed,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at
+        }
+
+
+def _encode(obj):
+    """JSON encoder hook for objects the serializers do not know.
+    
+    orjson serializes dataclasses natively; only the json module needs
+    this for Task.
+    """
+    if isinstance(obj, Task):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj):
+    """Serialize obj to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_encode)
+    return json.dumps(obj, default=_encode, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data):
+    """Parse UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _format_timestamp(timestamp):
+    """Format a stored timestamp (seconds since the epoch) for display."""
+    # Tasks saved by older versions hold an already formatted string.
+    if isinstance(timestamp, str):
+        return timestamp
+    return _format_second(int(timestamp))
+
+
+@lru_cache(maxsize=1024)
+def _format_second(second):
+    # Tasks added or completed together share a second, so listings
+    # mostly hit the cache instead of calling strftime per task.
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+
+# Reused across loads so simdjson can keep its internal buffers allocated.
+_snapshot_parser = simdjson.Parser() if simdjson is not None and orjson is None else None
+
+
+def _parse_snapshot(buffer):
+    """Parse the snapshot file contents.
+    
+    buffer may be any bytes-like object; orjson parses it in place, the
+    other parsers are handed a bytes copy, so orjson is preferred.
+    """
+    if orjson is not None:
+        with memoryview(buffer) as view:
+            return orjson.loads(view)
+    if _snapshot_parser is not None:
+        # Convert straight away: the parser cannot be reused while
+        # proxies into its previous document are still alive.
+        doc = _snapshot_parser.parse(bytes(buffer))
+        return doc.as_dict() if isinstance(doc, simdjson.Object) else doc.as_list()
+    return json.loads(bytes(buffer))
+
+
+def _load_snapshot(buffer):
+    """Parse the snapshot file contents into a list of Tasks.
+    
+    Snapshots are stored column by column (one list per task field);
+    older versions wrote a list of task objects, which is still accepted.
+    """
+    snapshot = _parse_snapshot(buffer)
+    if isinstance(snapshot, list):
+        return [Task.from_dict(task) for task in snapshot]
+    
+    # strict=True: columns of different lengths mean a damaged file,
+    # which must be reported rather than silently cut short.
+    return list(starmap(Task, zip(
+        snapshot["id"], snapshot["description"], snapshot["completed"],
+        snapshot["created_at"], snapshot["completed_at"], strict=True
+    )))
+
+
+def _dump_snapshot(tasks):
+    """Serialize tasks column by column for the snapshot file.
+    
+    Field names are written once instead of once per task, and each
+    column is a flat list of scalars, which keeps the file small and
+    quick to parse.
+    """
+    return _dumps({
+        "id": [task.id for task in tasks],
+        "description": [task.description for task in tasks],
+        "completed": [task.completed for task in tasks],
+        "created_at": [task.created_at for task in tasks],
+        "completed_at": [task.completed_at for task in tasks]
+    })
+
+
+def _renumber_duplicates(tasks):
+    """Give each task whose ID repeats an earlier task's ID a fresh ID.
+    
+    Versions before the journal assigned IDs as len(tasks) + 1, which
+    reuses an ID once a task has been removed. Returns the number of
+    tasks renumbered.
+    """
+    seen = set()
+    next_id = max((task.id for task in tasks), default=0) + 1
+    renumbered = 0
+    for task in tasks:
+        if task.id in seen:
+            task.id = next_id
+            next_id += 1
+            renumbered += 1
+        seen.add(task.id)
+    return renumbered
+
+
+def _decompress(buffer):
+    """Decompress a zstd-compressed snapshot."""
+    if zstandard is None:
+        raise ValueError("zstandard is required to read compressed task files")
+    try:
+        with zstandard.ZstdDecompressor().stream_reader(buffer) as reader:
+            return reader.read()
+    except zstandard.ZstdError as e:
+        raise ValueError(f"corrupt compressed task file: {e}") from e
+
+
+def _fsync_directory(path):
+    """Flush a directory entry change (such as a rename) to disk."""
+    # Directories cannot be opened for fsync on Windows.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class JsonStore:
+    """Task storage in a JSON snapshot file plus a JSON Lines journal.
+    
+    Every change is appended to the journal as one event; the snapshot is
+    only rewritten when the journal has grown long relative to the task list.
+    Snapshots whose filename ends in .zst are compressed with zstd; the
+    journal is always plain text so it can be appended to.
+    """
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.journal_filename = filename + ".jsonl"
+        self.compress = filename.endswith(".zst")
+        if self.compress and zstandard is None:
+            raise RuntimeError(f"The zstandard package is required to store tasks in {filename}")
+        self._journal = None
+        self._journal_len = 0
+    
+    def load(self):
+        """Return the stored tasks, replaying the journal over the snapshot.
+        
+        An unreadable snapshot raises ValueError instead of being treated
+        as empty, so it is never compacted over.
+        """
+        tasks = []
+        if os.path.exists(self.filename):
+            with open(self.filename, 'rb') as file:
+                # mmap cannot map an empty file.
+                if os.fstat(file.fileno()).st_size:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        # Check the first byte before handing the file to a
+                        # parser: blank files are treated as empty and
+                        # anything that cannot be JSON is rejected up front.
+                        start = _LEADING_WHITESPACE.match(content).end()
+                        head = content[start:start + 1]
+                        if content[:4] == ZSTD_MAGIC:
+                            tasks = _load_snapshot(_decompress(content))
+                        elif head in (b"[", b"{"):
+                            tasks = _load_snapshot(content)
+                        elif head:
+                            raise ValueError("not a JSON task snapshot")
+        
+        # Everything below keys tasks by ID, so duplicates must go first.
+        renumbered = _renumber_duplicates(tasks)
+        if renumbered:
+            print(f"Warning: Gave {renumbered} task(s) in {self.filename} a new ID because their ID was already in use.")
+        
+        # Only key the tasks by ID when there are journal events to apply.
+        if os.path.exists(self.journal_filename):
+            by_id = {task.id: task for task in tasks}
+            self._journal_len, intact = self._replay_journal(by_id)
+            tasks = list(by_id.values())
+        else:
+            self._journal_len, intact = 0, True
+        
+        # A torn last line must not have new events appended after it,
+        # and new IDs must be saved before any event refers to them.
+        if not intact or renumbered or self._journal_len > COMPACT_RATIO * len(tasks):
+            self.save(tasks)
+        return tasks
+    
+    def counts(self):
+        """Return (total, completed) without loading tasks, if supported.
+        
+        The JSON files have to be parsed to count anything, so this
+        returns None and callers load the tasks instead.
+        """
+        return None
+    
+    def _replay_journal(self, tasks):
+        """Apply journal events to tasks (a dict keyed by ID).
+        
+        Returns the number of events applied and whether the journal
+        was read to the end without hitting a partially written or
+        otherwise unreadable line; replay stops at the first such line.
+        A journal that does not end in a newline also counts as not
+        intact, since the next append would land on its last line.
+        """
+        count = 0
+        line = b""
+        with open(self.journal_filename, 'rb') as file:
+            for line in file:
+                try:
+                    self._apply_event(tasks, _loads(line))
+                except (ValueError, KeyError, TypeError):
+                    # ValueError covers bad JSON and a line cut inside a
+                    # UTF-8 character; KeyError and TypeError cover lines
+                    # that parse but are not a well-formed event.
+                    print(f"Warning: Ignoring incomplete entry in {self.journal_filename}.")
+                    return count, False
+                count += 1
+        return count, not line or line.endswith(b"\n")
+    
+    @staticmethod
+    def _apply_event(tasks, event):
+        """Apply one journal event to tasks, changing nothing if it is malformed."""
+        if event["op"] == "add":
+            task = Task.from_dict(event["task"])
+            tasks[task.id] = task
+        elif event["op"] == "complete":
+            completed_at = event["completed_at"]
+            task = tasks.get(event["id"])
+            if task is not None:
+                task.completed = True
+                task.completed_at = completed_at
+        elif event["op"] == "remove":
+            tasks.pop(event["id"], None)
+    
+    def save(self, tasks):
+        """Write all tasks to the snapshot file and reset the journal.
+        
+        The snapshot is written to a temporary file, flushed to disk and
+        then renamed over tasks.txt, so a crash leaves either the old or
+        the new snapshot in place, never a truncated one. The journal is
+        only removed once the new snapshot is durable.
+        """
+        tmp_filename = self.filename + ".tmp"
+        data = _dump_snapshot(tasks)
+        if self.compress:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        with open(tmp_filename, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_filename, self.filename)
+        _fsync_directory(os.path.dirname(os.path.abspath(self.filename)))
+        
+        self._close_journal()
+        if os.path.exists(self.journal_filename):
+            os.remove(self.journal_filename)
+        self._journal_len = 0
+    
+    def write(self, events, tasks):
+        """Append events to the journal, compacting it once it grows too long."""
+        if self._journal is None:
+            self._journal = open(self.journal_filename, 'ab', buffering=0)
+        self._journal.write(b"".join(_dumps(event) + b"\n" for event in events))
+        self._journal_len += len(events)
+        
+        if self._journal_len > COMPACT_RATIO * len(tasks):
+            self.save(tasks)
+    
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+    
+    def close(self):
+        """Release the journal file handle."""
+        self._close_journal()
+
+
+class SqliteStore:
+    """Task storage in an SQLite database with one row per task."""
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "id INTEGER PRIMARY KEY, "
+            "description TEXT NOT NULL, "
+            "completed INTEGER NOT NULL DEFAULT 0, "
+            "created_at INTEGER NOT NULL, "
+            "completed_at INTEGER)"
+        )
+    
+    def load(self):
+        """Return the stored tasks in ID order."""
+        rows = self.conn.execute(
+            "SELECT id, description, completed, created_at, completed_at FROM tasks ORDER BY id"
+        )
+        return [
+            Task(task_id, description, bool(completed), created_at, completed_at)
+            for task_id, description, completed, created_at, completed_at in rows
+        ]
+    
+    def counts(self):
+        """Return (total, completed) without loading tasks."""
+        total, completed = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(completed), 0) FROM tasks"
+        ).fetchone()
+        return total, completed
+    
+    def save(self, tasks):
+        """Replace the stored tasks with tasks."""
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.executemany(
+                "INSERT INTO tasks (id, description, completed, created_at, completed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(task.id, task.description, task.completed,
+                  task.created_at, task.completed_at) for task in tasks]
+            )
+    
+    def write(self, events, tasks):
+        """Apply journal-style events to the database in one transaction."""
+        with self.conn:
+            for event in events:
+                if event["op"] == "add":
+                    task = event["task"]
+                    self.conn.execute(
+                        "INSERT INTO tasks (id, description, completed, created_at, completed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (task.id, task.description, task.completed,
+                         task.created_at, task.completed_at)
+                    )
+                elif event["op"] == "complete":
+                    self.conn.execute(
+                        "UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?",
+                        (event["completed_at"], event["id"])
+                    )
+                elif event["op"] == "remove":
+                    self.conn.execute("DELETE FROM tasks WHERE id = ?", (event["id"],))
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
 
 class TodoApp:
-    def __init__(self, filename="tasks.txt"):
-        """Initialize the TodoApp with a filename for persistent storage."""
+    def __init__(self, filename="tasks.txt", verbose=True):
+        """Initialize the TodoApp with a filename for persistent storage.
+        
+        Filenames ending in .db are stored in SQLite; anything else is
+        stored as JSON, compressed with zstd if the name ends in .zst.
+        Tasks are not read until they are first needed.
+        
+        With verbose=False, confirmations, input errors and the views
+        print nothing, for scripted use; methods still return whether
+        they succeeded. Storage errors are always printed.
+        """
         self.filename = filename
-        self.tasks = []
-        self.load_tasks()
+        self.verbose = verbose
+        if filename.endswith(".db"):
+            self._store = SqliteStore(filename)
+        else:
+            self._store = JsonStore(filename)
+        self._tasks = None
+        self._by_id = {}
+        # Pending and completed tasks by ID, kept up to date by every
+        # change so views and statistics never have to filter self.tasks.
+        self._pending = {}
+        self._completed = {}
+        self._next_id = 1
+        self._batch_depth = 0
+        # Latest unwritten event for each task changed inside a batch.
+        self._dirty = {}
+    
+    @property
+    def tasks(self):
+        """The list of tasks, loaded from storage on first access."""
+        self._ensure_loaded()
+        return self._tasks
+    
+    def _ensure_loaded(self):
+        if self._tasks is None:
+            self.load_tasks()
     
     def load_tasks(self):
-        """Load tasks from the text file."""
+        """Load tasks from storage.
+        
+        If the store cannot be read the error is re-raised and the tasks
+        stay unloaded, so no change can be written over data that may
+        still be recoverable.
+        """
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    content = file.read().strip()
-                    if content:
-                        self.tasks = json.loads(content)
-                    else:
-                        self.tasks = []
-            else:
-                self.tasks = []
-        except (json.JSONDecodeError, FileNotFoundError):
-            print(f"Warning: Could not load tasks from {self.filename}. Starting with empty list.")
-            self.tasks = []
+            self._tasks = self._store.load()
+        except Exception as e:
+            print(f"Error: Could not load tasks from {self.filename} ({e}). No changes will be saved.")
+            raise
+        self._by_id = {task.id: task for task in self._tasks}
+        self._pending = {task.id: task for task in self._tasks if not task.completed}
+        self._completed = {task.id: task for task in self._tasks if task.completed}
+        self._next_id = max(self._by_id, default=0) + 1
     
     def save_tasks(self):
-        """Save tasks to the text file."""
+        """Write all tasks to storage."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(self.tasks, file, indent=2, ensure_ascii=False)
+            self._store.save(self.tasks)
+            # The full save already holds any changes batched so far.
+            self._dirty = {}
         except Exception as e:
             print(f"Error saving tasks: {e}")
     
+    def _log(self, *events):
+        """Record task changes in storage, or hold them until the batch ends."""
+        if self._batch_depth:
+            for event in events:
+                self._mark_dirty(event)
+            return
+        try:
+            self._store.write(events, self.tasks)
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+    
+    @contextmanager
+    def batch(self):
+        """Defer writing changes to storage until the block exits.
+        
+        Batches may be nested; changes are written once the outermost
+        batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                events, self._dirty = list(self._dirty.values()), {}
+                self._log(*events)
+    
+    def _mark_dirty(self, event):
+        """Fold event into the batch so each task is written at most once."""
+        task_id = event["task"].id if event["op"] == "add" else event["id"]
+        earlier = self._dirty.get(task_id)
+        
+        if earlier is not None and earlier["op"] == "add":
+            # The add event holds the task itself, so it already reflects
+            # a later completion; a later removal means it never existed.
+            if event["op"] == "remove":
+                del self._dirty[task_id]
+            return
+        self._dirty[task_id] = event
+    
+    def close(self):
+        """Release any open storage handles."""
+        self._store.close()
+    
+    def _emit(self, message):
+        """Print a message unless the app is quiet."""
+        if self.verbose:
+            print(message)
+    
     def add_task(self, task_description):
         """Add a new task to the list."""
         if not task_description.strip():
-            print("Error: Task description cannot be empty!")
+            self._emit("Error: Task description cannot be empty!")
             return False
         
-        task = {
-            "id": len(self.tasks) + 1,
-            "description": task_description.strip(),
-            "completed": False,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+        self._ensure_loaded()
+        task = Task(self._next_id, task_description.strip(), created_at=int(time.time()))
         
-        self.tasks.append(task)
-        self.save_tasks()
-        print(f"✓ Task added successfully: '{task_description}'")
+        self._tasks.append(task)
+        self._by_id[task.id] = task
+        self._pending[task.id] = task
+        self._next_id += 1
+        self._log({"op": "add", "task": task})
+        self._emit(f"✓ Task added successfully: '{task_description}'")
         return True
     
+    def add_tasks_batch(self, task_descriptions):
+        """Add several tasks, writing them to storage once.
+        
+        Returns the number of tasks added.
+        """
+        with self.batch():
+            return sum(1 for task_description in task_descriptions if self.add_task(task_description))
+    
     def remove_task(self, task_id):
         """Remove a task by its ID."""
         try:
             task_id = int(task_id)
         except ValueError:
-            print("Error: Please enter a valid task ID (number)!")
+            self._emit("Error: Please enter a valid task ID (number)!")
             return False
         
-        # Find task by ID
-        task_to_remove = None
-        task_index = None
-        
-        for i, task in enumerate(self.tasks):
-            if task["id"] == task_id:
-                task_to_remove = task
-                task_index = i
-                break
+        self._ensure_loaded()
+        removed_task = self._by_id.pop(task_id, None)
         
-        if task_to_remove:
-            removed_task = self.tasks.pop(task_index)
-            self.save_tasks()
-            print(f"✓ Task removed: '{removed_task['description']}'")
+        if removed_task is not None:
+            self._tasks.remove(removed_task)
+            self._pending.pop(task_id, None)
+            self._completed.pop(task_id, None)
+            self._log({"op": "remove", "id": task_id})
+            self._emit(f"✓ Task removed: '{removed_task.description}'")
             return True
         else:
-            print(f"Error: No task found with ID {task_id}")
+            self._emit(f"Error: No task found with ID {task_id}")
             return False
     
     def mark_completed(self, task_id):
@@ -96,131 +608,209 @@ class TodoApp:
         try:
             task_id = int(task_id)
         except ValueError:
-            print("Error: Please enter a valid task ID (number)!")
+            self._emit("Error: Please enter a valid task ID (number)!")
             return False
         
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task["completed"] = True
-                task["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.save_tasks()
-                print(f"✓ Task marked as completed: '{task['description']}'")
-                return True
+        self._ensure_loaded()
+        task = self._by_id.get(task_id)
+        if task is None:
+            self._emit(f"Error: No task found with ID {task_id}")
+            return False
         
-        print(f"Error: No task found with ID {task_id}")
-        return False
+        task.completed = True
+        task.completed_at = int(time.time())
+        self._pending.pop(task_id, None)
+        self._completed[task_id] = task
+        self._log({"op": "complete", "id": task_id, "completed_at": task.completed_at})
+        self._emit(f"✓ Task marked as completed: '{task.description}'")
+        return True
+    
+    def has_pending(self):
+        """Return True if any task is not yet completed."""
+        self._ensure_loaded()
+        return bool(self._pending)
     
     def view_tasks(self, show_completed=True):
         """Display all tasks."""
+        if not self.verbose:
+            return
         if not self.tasks:
-            print("\n📝 No tasks found! Your to-do list is empty.")
+            self._emit("\n📝 No tasks found! Your to-do list is empty.")
             return
         
-        print(f"\n📋 Your To-Do List ({len(self.tasks)} tasks):")
-        print("-" * 60)
+        pending_tasks = self._pending.values()
+        completed_tasks = self._completed.values()
         
-        pending_tasks = [task for task in self.tasks if not task["completed"]]
-        completed_tasks = [task for task in self.tasks if task["completed"]]
+        # Build the listing first and write it in one call rather than
+        # printing each line separately.
+        lines = [f"\n📋 Your To-Do List ({len(self.tasks)} tasks):", "-" * 60]
         
         # Show pending tasks
         if pending_tasks:
-            print("🔄 PENDING TASKS:")
+            lines.append("🔄 PENDING TASKS:")
             for task in pending_tasks:
-                status = "⏳"
-                print(f"  {status} [{task['id']}] {task['description']}")
-                print(f"      Created: {task['created_at']}")
+                lines.append(f"  ⏳ [{task.id}] {task.description}")
+                lines.append(f"      Created: {_format_timestamp(task.created_at)}")
         
         # Show completed tasks if requested
         if show_completed and completed_tasks:
-            print("\n✅ COMPLETED TASKS:")
+            lines.append("\n✅ COMPLETED TASKS:")
             for task in completed_tasks:
-                status = "✓"
-                print(f"  {status} [{task['id']}] {task['description']}")
-                print(f"      Completed: {task.get('completed_at', 'Unknown')}")
+                lines.append(f"  ✓ [{task.id}] {task.description}")
+                if task.completed_at is not None:
+                    lines.append(f"      Completed: {_format_timestamp(task.completed_at)}")
+                else:
+                    lines.append("      Completed: Unknown")
         
-        print("-" * 60)
-        print(f"📊 Summary: {len(pending_tasks)} pending, {len(completed_tasks)} completed")
+        lines.append("-" * 60)
+        lines.append(f"📊 Summary: {len(pending_tasks)} pending, {len(completed_tasks)} completed")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def view_pending_only(self):
         """Display only pending tasks."""
-        pending_tasks = [task for task in self.tasks if not task["completed"]]
+        if not self.verbose:
+            return
+        self._ensure_loaded()
+        pending_tasks = self._pending.values()
         
         if not pending_tasks:
-            print("\n🎉 Great! No pending tasks. You're all caught up!")
+            self._emit("\n🎉 Great! No pending tasks. You're all caught up!")
             return
         
-        print(f"\n⏳ Pending Tasks ({len(pending_tasks)}):")
-        print("-" * 40)
-        
+        lines = [f"\n⏳ Pending Tasks ({len(pending_tasks)}):", "-" * 40]
         for task in pending_tasks:
-            print(f"  [{task['id']}] {task['description']}")
-            print(f"      Created: {task['created_at']}")
-        
-        print("-" * 40)
+            lines.append(f"  [{task.id}] {task.description}")
+            lines.append(f"      Created: {_format_timestamp(task.created_at)}")
+        lines.append("-" * 40)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def clear_completed(self):
         """Remove all completed tasks."""
-        completed_count = len([task for task in self.tasks if task["completed"]])
-        
-        if completed_count == 0:
-            print("No completed tasks to clear!")
+        self._ensure_loaded()
+        if not self._completed:
+            self._emit("No completed tasks to clear!")
             return
         
-        self.tasks = [task for task in self.tasks if not task["completed"]]
-        self.save_tasks()
-        print(f"✓ Cleared {completed_count} completed task(s)")
+        completed_ids = list(self._completed)
+        self._tasks = list(self._pending.values())
+        self._by_id = dict(self._pending)
+        self._completed = {}
+        self._log(*({"op": "remove", "id": task_id} for task_id in completed_ids))
+        self._emit(f"✓ Cleared {len(completed_ids)} completed task(s)")
     
     def show_stats(self):
         """Display task statistics."""
-        if not self.tasks:
-            print("\n📊 Statistics: No tasks available")
+        if not self.verbose:
             return
-        
-        total = len(self.tasks)
-        completed = len([task for task in self.tasks if task["completed"]])
+        # Ask the store for the counts if the tasks have not been loaded;
+        # SQLite can answer without reading any rows.
+        counts = self._store.counts() if self._tasks is None else None
+        if counts is None:
+            total, completed = len(self.tasks), len(self._completed)
+        else:
+            total, completed = counts
         pending = total - completed
+        
+        if not total:
+            self._emit("\n📊 Statistics: No tasks available")
+            return
+        
         completion_rate = (completed / total * 100) if total > 0 else 0
         
-        print(f"\n📊 Task Statistics:")
-        print(f"  Total tasks: {total}")
-        print(f"  Completed: {completed}")
-        print(f"  Pending: {pending}")
-        print(f"  Completion rate: {completion_rate:.1f}%")
+        buf = io.StringIO()
+        print(f"\n📊 Task Statistics:", file=buf)
+        print(f"  Total tasks: {total}", file=buf)
+        print(f"  Completed: {completed}", file=buf)
+        print(f"  Pending: {pending}", file=buf)
+        print(f"  Completion rate: {completion_rate:.1f}%", file=buf)
+        sys.stdout.write(buf.getvalue())
 
 
 def show_menu():
     """Display the main menu."""
-    print("\n" + "="*50)
-    print("📝 TO-DO LIST MANAGER")
-    print("="*50)
-    print("1. Add Task")
-    print("2. View All Tasks")
-    print("3. View Pending Tasks Only")
-    print("4. Mark Task as Completed")
-    print("5. Remove Task")
-    print("6. Clear Completed Tasks")
-    print("7. Show Statistics")
-    print("8. Help")
-    print("9. Exit")
-    print("-"*50)
-
-
-def show_help():
-    """Display help information."""
-    print("\n📖 HELP - How to use this To-Do List Manager:")
-    print("-" * 50)
-    print("• Add Task: Enter a description for your new task")
-    print("• View Tasks: See all your tasks with their status")
-    print("• Mark Completed: Enter the task ID to mark it as done")
-    print("• Remove Task: Enter the task ID to delete it permanently")
-    print("• Task IDs: Each task has a unique number in [brackets]")
-    print("• Data Storage: Tasks are automatically saved to 'tasks.txt'")
-    print("-" * 50)
+    # Shown on every pass of the main loop: collect the lines and
+    # write them to stdout in one call.
+    buf = io.StringIO()
+    print("\n" + "="*50, file=buf)
+    print("📝 TO-DO LIST MANAGER", file=buf)
+    print("="*50, file=buf)
+    print("1. Add Task", file=buf)
+    print("2. View All Tasks", file=buf)
+    print("3. View Pending Tasks Only", file=buf)
+    print("4. Mark Task as Completed", file=buf)
+    print("5. Remove Task", file=buf)
+    print("6. Clear Completed Tasks", file=buf)
+    print("7. Show Statistics", file=buf)
+    print("8. Help", file=buf)
+    print("9. Exit", file=buf)
+    print("-"*50, file=buf)
+    sys.stdout.write(buf.getvalue())
+
+
+def show_help(filename="tasks.txt"):
+    """Display help information for tasks stored in filename."""
+    buf = io.StringIO()
+    print("\n📖 HELP - How to use this To-Do List Manager:", file=buf)
+    print("-" * 50, file=buf)
+    print("• Add Task: Enter a description for your new task", file=buf)
+    print("• View Tasks: See all your tasks with their status", file=buf)
+    print("• Mark Completed: Enter the task ID to mark it as done", file=buf)
+    print("• Remove Task: Enter the task ID to delete it permanently", file=buf)
+    print("• Task IDs: Each task has a unique number in [brackets]", file=buf)
+    print(f"• Data Storage: Tasks are automatically saved to '{filename}'", file=buf)
+    print("-" * 50, file=buf)
+    sys.stdout.write(buf.getvalue())
+
+
+def add_task_prompt(todo_app):
+    """Menu option 1: Add Task."""
+    task_desc = input("\n📝 Enter task description: ").strip()
+    if task_desc:
+        todo_app.add_task(task_desc)
+    else:
+        print("❌ Task description cannot be empty!")
+
+
+def mark_completed_prompt(todo_app):
+    """Menu option 4: Mark Task as Completed."""
+    todo_app.view_pending_only()
+    if todo_app.has_pending():
+        task_id = input("\n✅ Enter task ID to mark as completed: ").strip()
+        todo_app.mark_completed(task_id)
+
+
+def remove_task_prompt(todo_app):
+    """Menu option 5: Remove Task."""
+    todo_app.view_tasks()
+    if todo_app.tasks:
+        task_id = input("\n🗑️  Enter task ID to remove: ").strip()
+        todo_app.remove_task(task_id)
+
+
+def exit_app(todo_app):
+    """Menu option 9: Exit. Returns False to stop the main loop."""
+    print("\n👋 Thank you for using To-Do List Manager!")
+    print("💾 All your tasks have been saved automatically.")
+    return False
+
+
+# Menu choice -> handler taking the TodoApp instance.
+MENU_ACTIONS = {
+    '1': add_task_prompt,
+    '2': TodoApp.view_tasks,
+    '3': TodoApp.view_pending_only,
+    '4': mark_completed_prompt,
+    '5': remove_task_prompt,
+    '6': TodoApp.clear_completed,
+    '7': TodoApp.show_stats,
+    '8': lambda todo_app: show_help(todo_app.filename),
+    '9': exit_app,
+}
 
 
 def main():
     """Main application loop."""
-    todo_app = TodoApp()
+    todo_app = TodoApp(*sys.argv[1:2])
     
     print("🚀 Welcome to your Personal To-Do List Manager!")
     print(f"📁 Tasks are stored in: {todo_app.filename}")
@@ -231,63 +821,21 @@ def main():
         try:
             choice = input("Enter your choice (1-9): ").strip()
             
-            if choice == '1':
-                # Add Task
-                task_desc = input("\n📝 Enter task description: ").strip()
-                if task_desc:
-                    todo_app.add_task(task_desc)
-                else:
-                    print("❌ Task description cannot be empty!")
-            
-            elif choice == '2':
-                # View All Tasks
-                todo_app.view_tasks()
-            
-            elif choice == '3':
-                # View Pending Tasks Only
-                todo_app.view_pending_only()
-            
-            elif choice == '4':
-                # Mark Task as Completed
-                todo_app.view_pending_only()
-                if any(not task["completed"] for task in todo_app.tasks):
-                    task_id = input("\n✅ Enter task ID to mark as completed: ").strip()
-                    todo_app.mark_completed(task_id)
-            
-            elif choice == '5':
-                # Remove Task
-                todo_app.view_tasks()
-                if todo_app.tasks:
-                    task_id = input("\n🗑️  Enter task ID to remove: ").strip()
-                    todo_app.remove_task(task_id)
-            
-            elif choice == '6':
-                # Clear Completed Tasks
-                todo_app.clear_completed()
-            
-            elif choice == '7':
-                # Show Statistics
-                todo_app.show_stats()
-            
-            elif choice == '8':
-                # Help
-                show_help()
-            
-            elif choice == '9':
-                # Exit
-                print("\n👋 Thank you for using To-Do List Manager!")
-                print("💾 All your tasks have been saved automatically.")
-                break
-            
-            else:
+            action = MENU_ACTIONS.get(choice)
+            if action is None:
                 print("❌ Invalid choice! Please enter a number between 1-9.")
+            elif action(todo_app) is False:
+                break
         
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
+            # EOFError: input was piped in and has run out.
             print("\n\n👋 Goodbye! Your tasks have been saved.")
             break
         except Exception as e:
             print(f"❌ An error occurred: {e}")
+    
+    todo_app.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()